@@ -0,0 +1,5 @@
+"""Single-cycle MIPS-style CPU simulator (MVC + Observer).
+
+Model: `cpu.model`, View: `cpu.view`, Controller: `cpu.controller`; the CLI
+entry point is `python -m cpu.main`.
+"""
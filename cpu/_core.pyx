@@ -0,0 +1,153 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Cython build of `jit_core.run_native` for installs without Numba.
+
+Same contract, same status codes, same buffers (`array('I')` memory and
+registers, `array('q')` counters); only the types are pinned down so the
+switch compiles to plain C with no JIT warm-up. Build it with `make cext`;
+`jit_core` picks it up automatically when the extension is importable.
+"""
+
+from libc.stdint cimport uint32_t, int32_t, int16_t, int64_t
+
+# Mirrors cpu.isa / cpu.stats / cpu.jit_core; cimport-free so the .pyx
+# builds standalone.
+cdef enum:
+    OP_RTYPE = 0x00
+    OP_J     = 0x02
+    OP_BEQ   = 0x04
+    OP_ADDI  = 0x08
+    OP_LW    = 0x23
+    OP_SW    = 0x2B
+
+    FUNCT_ADD = 0x20
+    FUNCT_SUB = 0x22
+    FUNCT_AND = 0x24
+    FUNCT_OR  = 0x25
+    FUNCT_SLT = 0x2A
+
+    ALU_ADD = 0
+    ALU_SUB = 1
+    ALU_AND = 2
+    ALU_OR  = 3
+    ALU_SLT = 4
+
+    I_ADD = 0
+    I_SUB = 1
+    I_AND = 2
+    I_OR  = 3
+    I_SLT = 4
+    I_ADDI = 5
+    I_LW = 6
+    I_SW = 7
+    I_BEQ = 8
+    I_J = 9
+    I_HALT = 10
+
+    STATUS_BUDGET = 0
+    STATUS_HALTED = 1
+    STATUS_FAULT = 2
+
+cdef uint32_t HALT_WORD = 0xFFFFFFFF
+
+
+def run_native(uint32_t[::1] mem, uint32_t[::1] regs, int64_t pc, int64_t max_cycles,
+               int64_t[::1] alu_counters, int64_t[::1] instr_counters):
+    """Execute up to max_cycles instructions (-1 = no limit) starting at pc.
+
+    Returns `(pc, status, cycles, data_reads, data_writes)`; see
+    `jit_core.run_native` for the full contract.
+    """
+    cdef Py_ssize_t nwords = mem.shape[0]
+    cdef int64_t n = 0, reads = 0, writes = 0, next_pc
+    cdef uint32_t word, a, b, res, addr
+    cdef unsigned int opcode, rs, rt, rd, funct
+    cdef int32_t imm
+    cdef int alu, ins
+
+    while max_cycles < 0 or n < max_cycles:
+        if pc & 3 or pc < 0 or (pc >> 2) >= nwords:
+            return pc, STATUS_FAULT, n, reads, writes
+        word = mem[pc >> 2]
+        if word == HALT_WORD:
+            instr_counters[I_HALT] += 1
+            return pc, STATUS_HALTED, n + 1, reads, writes
+
+        opcode = (word >> 26) & 0x3F
+        rs = (word >> 21) & 0x1F
+        rt = (word >> 16) & 0x1F
+        imm = <int16_t>(word & 0xFFFF)
+        a = regs[rs]
+        b = regs[rt]
+        next_pc = pc + 4
+
+        if opcode == OP_RTYPE:
+            rd = (word >> 11) & 0x1F
+            funct = word & 0x3F
+            if funct == FUNCT_ADD:
+                res = a + b
+                alu = ALU_ADD
+                ins = I_ADD
+            elif funct == FUNCT_SUB:
+                res = a - b
+                alu = ALU_SUB
+                ins = I_SUB
+            elif funct == FUNCT_AND:
+                res = a & b
+                alu = ALU_AND
+                ins = I_AND
+            elif funct == FUNCT_OR:
+                res = a | b
+                alu = ALU_OR
+                ins = I_OR
+            elif funct == FUNCT_SLT:
+                res = <int32_t>a < <int32_t>b
+                alu = ALU_SLT
+                ins = I_SLT
+            else:
+                return pc, STATUS_FAULT, n, reads, writes
+            if rd != 0:
+                regs[rd] = res
+            alu_counters[alu] += 1
+            instr_counters[ins] += 1
+
+        elif opcode == OP_ADDI:
+            if rt != 0:
+                regs[rt] = a + <uint32_t>imm
+            alu_counters[ALU_ADD] += 1
+            instr_counters[I_ADDI] += 1
+
+        elif opcode == OP_LW:
+            addr = a + <uint32_t>imm
+            if addr & 3 or (addr >> 2) >= nwords:
+                return pc, STATUS_FAULT, n, reads, writes
+            if rt != 0:
+                regs[rt] = mem[addr >> 2]
+            alu_counters[ALU_ADD] += 1
+            reads += 1
+            instr_counters[I_LW] += 1
+
+        elif opcode == OP_SW:
+            addr = a + <uint32_t>imm
+            if addr & 3 or (addr >> 2) >= nwords:
+                return pc, STATUS_FAULT, n, reads, writes
+            mem[addr >> 2] = b
+            alu_counters[ALU_ADD] += 1
+            writes += 1
+            instr_counters[I_SW] += 1
+
+        elif opcode == OP_BEQ:
+            if a == b:
+                next_pc = pc + 4 + <int64_t>imm * 4
+            alu_counters[ALU_SUB] += 1
+            instr_counters[I_BEQ] += 1
+
+        elif opcode == OP_J:
+            next_pc = ((pc + 4) & 0xF0000000) | (<int64_t>(word & 0x3FFFFFF) << 2)
+            instr_counters[I_J] += 1
+
+        else:
+            return pc, STATUS_FAULT, n, reads, writes
+
+        pc = next_pc
+        n += 1
+    return pc, STATUS_BUDGET, n, reads, writes
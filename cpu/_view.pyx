@@ -0,0 +1,85 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Cython builds of TextView's two dump helpers.
+
+Every row is written into one C buffer with a small hex-digit loop and
+returned as ASCII bytes, byte-for-byte what the Python versions in
+cpu/view.py produce.
+Build with `make cext`; TextView uses these only when the extension imports.
+"""
+
+from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy
+
+cdef const char *HEX = b"0123456789abcdef"
+
+
+cdef inline int put_hex(char *out, unsigned int v, int width, bint prefix, char pad) noexcept:
+    """Write v in lowercase hex right-aligned in width chars; return width."""
+    cdef int k = width
+    # Digits go in from the right; "0x" (if asked) and the padding follow.
+    while True:
+        k -= 1
+        out[k] = HEX[v & 0xF]
+        v >>= 4
+        if not v:
+            break
+    if prefix:
+        out[k - 1] = b'x'
+        out[k - 2] = b'0'
+        k -= 2
+    while k > 0:
+        k -= 1
+        out[k] = pad
+    return width
+
+
+def dump_registers(unsigned int[::1] regs, bytes labels):
+    """Format regs[0:32] as eight rows of four `label=value` cells.
+
+    labels is the 32 padded register labels concatenated; every label has the
+    same width.
+    """
+    cdef char buf[1024]
+    cdef const char *lab = labels
+    cdef int width = len(labels) // 32
+    cdef int i, n = 0
+    for i in range(32):
+        memcpy(buf + n, lab + i * width, width)
+        n += width
+        buf[n] = b'='
+        n += 1
+        n += put_hex(buf + n, regs[i], 10, True, b' ')   # same as "%#10x"
+        if i == 31:
+            break
+        if i % 4 == 3:
+            buf[n] = b'\n'
+            n += 1
+        else:
+            buf[n] = b' '
+            buf[n + 1] = b' '
+            n += 2
+    return buf[:n]
+
+
+def dump_memory(unsigned int[::1] words):
+    """Format words as `address: value` lines, one per word."""
+    cdef Py_ssize_t count = words.shape[0], i
+    cdef Py_ssize_t n = 0
+    cdef char *buf
+    if count == 0:
+        return b""
+    buf = <char*>malloc(count * 19)   # "xxxxxxxx: xxxxxxxx\n"
+    if buf == NULL:
+        raise MemoryError()
+    try:
+        for i in range(count):
+            n += put_hex(buf + n, <unsigned int>(i * 4), 8, False, b'0')
+            buf[n] = b':'
+            buf[n + 1] = b' '
+            n += 2
+            n += put_hex(buf + n, words[i], 8, False, b'0')
+            buf[n] = b'\n'
+            n += 1
+        return buf[:n - 1]
+    finally:
+        free(buf)
@@ -7,6 +7,8 @@ having to reuse their entire Project 1 while still allowing `.asm` inputs during
 grading.
 """
 
+import re
+
 from . import isa
 
 reg_alias = {
@@ -32,15 +34,75 @@ def parse_imm(tok: str) -> int:
         return int(tok, 16)
     return int(tok, 10)
 
+# Operand shapes, compiled once. Each group is one raw token; the parse_*
+# helpers turn it into a number so bad registers/immediates keep their
+# specific error messages.
+_TOK = r"\s*([^,\s()]+)\s*"
+_OPS3 = re.compile(rf"{_TOK},{_TOK},{_TOK}$")           # rd, rs, rt / rt, rs, imm / rs, rt, label
+_OPS_MEM = re.compile(rf"{_TOK},\s*(.+?)\s*$")        # rt, imm(rs)
+_OPS1 = re.compile(rf"{_TOK}(?:,.*)?$")                # label (extra operands ignored)
+_OPS0 = re.compile(r".*$")                             # halt ignores anything after it
+_MEM_OPERAND = re.compile(rf"{_TOK}\({_TOK}\)\s*$")
+
 def parse_offset_addr(tok: str) -> (int,int):
     """Parse MIPS-style mem operands of the form imm(rs)."""
-    # format: imm(rs)
-    tok = tok.strip().rstrip(',')
-    if '(' in tok and tok.endswith(')'):
-        imm_s, rs_s = tok.split('(')
-        rs_s = rs_s[:-1]
-        return parse_imm(imm_s), parse_reg(rs_s)
-    raise ValueError(f"Bad memory operand {tok} (want imm(rs))")
+    m = _MEM_OPERAND.match(tok.strip().rstrip(','))
+    if m is None:
+        raise ValueError(f"Bad memory operand {tok.strip()} (want imm(rs))")
+    return parse_imm(m[1]), parse_reg(m[2])
+
+def _label(tok: str, labels: dict) -> int:
+    """Resolve a branch/jump label to its byte address."""
+    if tok not in labels:
+        raise ValueError(f"Unknown label {tok}")
+    return labels[tok]
+
+def _enc_rtype(funct):
+    """Build the encoder for an R-type op: rd, rs, rt."""
+    def enc(m, pc, labels):
+        rd, rs, rt = parse_reg(m[1]), parse_reg(m[2]), parse_reg(m[3])
+        return isa.encode_r(rs, rt, rd, 0, funct)
+    return enc
+
+def _enc_addi(m, pc, labels):
+    """addi rt, rs, imm"""
+    return isa.encode_i(isa.OP_ADDI, parse_reg(m[2]), parse_reg(m[1]), parse_imm(m[3]))
+
+def _enc_mem(op):
+    """Build the encoder for a load/store: rt, imm(rs)."""
+    def enc(m, pc, labels):
+        imm, rs = parse_offset_addr(m[2])
+        return isa.encode_i(op, rs, parse_reg(m[1]), imm)
+    return enc
+
+def _enc_beq(m, pc, labels):
+    """beq rs, rt, label -- offset is in words relative to PC+4."""
+    rs, rt = parse_reg(m[1]), parse_reg(m[2])
+    imm = (_label(m[3], labels) - (pc + 4)) // 4
+    return isa.encode_i(isa.OP_BEQ, rs, rt, imm & 0xFFFF)
+
+def _enc_j(m, pc, labels):
+    """j label -- 26-bit word address."""
+    return isa.encode_j(isa.OP_J, (_label(m[1], labels) >> 2) & 0x3FFFFFF)
+
+def _enc_halt(m, pc, labels):
+    """halt is the all-ones sentinel word."""
+    return isa.HALT_WORD
+
+# mnemonic -> (operand pattern, encoder(match, pc, labels) -> word)
+ENCODERS = {
+    'add':  (_OPS3, _enc_rtype(isa.FUNCT_ADD)),
+    'sub':  (_OPS3, _enc_rtype(isa.FUNCT_SUB)),
+    'and':  (_OPS3, _enc_rtype(isa.FUNCT_AND)),
+    'or':   (_OPS3, _enc_rtype(isa.FUNCT_OR)),
+    'slt':  (_OPS3, _enc_rtype(isa.FUNCT_SLT)),
+    'addi': (_OPS3, _enc_addi),
+    'lw':   (_OPS_MEM, _enc_mem(isa.OP_LW)),
+    'sw':   (_OPS_MEM, _enc_mem(isa.OP_SW)),
+    'beq':  (_OPS3, _enc_beq),
+    'j':    (_OPS1, _enc_j),
+    'halt': (_OPS0, _enc_halt),
+}
 
 def assemble(lines):
     """Convert a tiny MIPS-like assembly listing into machine words."""
@@ -59,65 +121,20 @@ def assemble(lines):
             cleaned.append(s)
             pc += 4
 
+    # Second pass: one dict lookup picks the operand pattern and encoder, and
+    # a single regex match splits the operands.
     words = []
     pc = 0
     for s in cleaned:
-        parts = [p.strip() for p in s.replace('\t', ' ').split()]
+        parts = s.split(None, 1)
         mn = parts[0].lower()
-        ops = " ".join(parts[1:])
-
-        def split_ops(k=3):
-            """Split the operand list into k comma-separated tokens."""
-            return [x.strip() for x in ops.split(',')]
-
-        if mn in ('add','sub','and','or','slt'):
-            rd, rs, rt = split_ops(3)
-            rd, rs, rt = parse_reg(rd), parse_reg(rs), parse_reg(rt)
-            funct = {'add': isa.FUNCT_ADD, 'sub': isa.FUNCT_SUB, 'and': isa.FUNCT_AND,
-                     'or': isa.FUNCT_OR, 'slt': isa.FUNCT_SLT}[mn]
-            w = isa.encode_r(rs, rt, rd, 0, funct)
-
-        elif mn == 'addi':
-            rt, rs, imm = split_ops(3)
-            rt, rs, imm = parse_reg(rt), parse_reg(rs), parse_imm(imm)
-            w = isa.encode_i(isa.OP_ADDI, rs, rt, imm)
-
-        elif mn == 'lw':
-            rt, memop = split_ops(2)
-            rt = parse_reg(rt)
-            imm, rs = parse_offset_addr(memop)
-            w = isa.encode_i(isa.OP_LW, rs, rt, imm)
-
-        elif mn == 'sw':
-            rt, memop = split_ops(2)
-            rt = parse_reg(rt)
-            imm, rs = parse_offset_addr(memop)
-            w = isa.encode_i(isa.OP_SW, rs, rt, imm)
-
-        elif mn == 'beq':
-            rs, rt, label = split_ops(3)
-            rs, rt = parse_reg(rs), parse_reg(rt)
-            if label not in labels:
-                raise ValueError(f"Unknown label {label}")
-            target = labels[label]
-            # imm = (target - (pc+4)) >> 2
-            imm = (target - (pc + 4)) // 4
-            w = isa.encode_i(isa.OP_BEQ, rs, rt, imm & 0xFFFF)
-
-        elif mn == 'j':
-            label = split_ops(1)[0]
-            if label not in labels:
-                raise ValueError(f"Unknown label {label}")
-            target = labels[label]
-            addr = (target >> 2) & 0x3FFFFFF
-            w = isa.encode_j(isa.OP_J, addr)
-
-        elif mn == 'halt':
-            w = isa.HALT_WORD
-
-        else:
+        ops = parts[1] if len(parts) > 1 else ""
+        if mn not in ENCODERS:
             raise ValueError(f"Unknown mnemonic {mn}")
-
-        words.append(w)
+        pattern, enc = ENCODERS[mn]
+        m = pattern.match(ops)
+        if m is None:
+            raise ValueError(f"Bad operands for {mn}: {ops}")
+        words.append(enc(m, pc, labels))
         pc += 4
     return words
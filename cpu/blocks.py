@@ -0,0 +1,129 @@
+"""Basic-block compiler for the pure-Python fast path.
+
+`compile_block` turns the straight-line run of instructions starting at a PC
+(up to and including the `beq`/`j` that ends it) into one generated Python
+function, so a loop body costs one call per iteration instead of one dispatch
+per instruction. `CPUModel._run_blocks` drives the compiled blocks; anything a
+block cannot express (halt, unknown encodings, bad addresses) is left to the
+ordinary `CPUModel._cycle` path.
+
+A block function takes `(regs, words)` -- `CPUModel.regs` and the memory's
+`array('I')` storage -- and returns the next PC. A negative result `-1 - pc`
+means it stopped early with `pc` as the next instruction to run:
+- at its own start, when memory under the block no longer matches the words
+  it was compiled from, or its first instruction would fault;
+- at a faulting `lw`/`sw` further in (nothing of that instruction has run);
+- just after a `sw` that overwrote one of the block's own words.
+The instructions before that point have all retired; `Block.ops` lets the
+caller account for them.
+"""
+
+from array import array
+
+from . import isa
+from .stats import (ALU_ADD, ALU_SUB, ALU_AND, ALU_OR, ALU_SLT,
+                    I_ADD, I_SUB, I_AND, I_OR, I_SLT, I_ADDI, I_LW, I_SW, I_BEQ, I_J)
+
+MAX_BLOCK = 64   # instructions; keeps generated functions (and stale re-checks) small
+
+# funct -> (expression template, ALU counter, instruction counter)
+_RTYPE = {
+    isa.FUNCT_ADD: ("(R[{rs}] + R[{rt}]) & 0xFFFFFFFF", ALU_ADD, I_ADD),
+    isa.FUNCT_SUB: ("(R[{rs}] - R[{rt}]) & 0xFFFFFFFF", ALU_SUB, I_SUB),
+    isa.FUNCT_AND: ("R[{rs}] & R[{rt}]", ALU_AND, I_AND),
+    isa.FUNCT_OR:  ("R[{rs}] | R[{rt}]", ALU_OR, I_OR),
+    isa.FUNCT_SLT: ("(R[{rs}] ^ 0x80000000) < (R[{rt}] ^ 0x80000000)", ALU_SLT, I_SLT),
+}
+
+
+class Block:
+    """One compiled basic block plus what it adds to Stats per execution."""
+
+    __slots__ = ("fn", "start", "n", "hits", "ops", "reads", "writes", "alu", "instr")
+
+    def __init__(self, fn, start, ops):
+        self.fn = fn
+        self.start = start
+        self.n = len(ops)
+        self.hits = 0         # full executions not yet folded into Stats
+        # Per instruction: (ALU counter or -1, instruction counter, reads, writes)
+        self.ops = ops
+        self.reads = sum(op[2] for op in ops)
+        self.writes = sum(op[3] for op in ops)
+        self.alu = _tally(op[0] for op in ops if op[0] >= 0)
+        self.instr = _tally(op[1] for op in ops)
+
+
+def _tally(indices):
+    """Return [(index, count), ...] for an iterable of counter indices."""
+    counts = {}
+    for i in indices:
+        counts[i] = counts.get(i, 0) + 1
+    return sorted(counts.items())
+
+
+def compile_block(words: array, pc: int):
+    """Compile the block starting at pc, or return None if it would be empty."""
+    nwords = len(words)
+    if pc & 3 or pc < 0 or (pc >> 2) >= nwords:
+        return None
+    start = pc >> 2
+    body = []
+    ops = []
+    end = None      # terminating return statement, if any
+    while len(ops) < MAX_BLOCK and (pc >> 2) < nwords:
+        raw = words[pc >> 2]
+        d = isa.decode(raw)
+        op = d.opcode
+        rs, rt = d.rs, d.rt
+        if op == isa.OP_RTYPE:
+            if d.funct not in _RTYPE:
+                break
+            expr, alu, ins = _RTYPE[d.funct]
+            if d.rd:
+                body.append(f"R[{d.rd}] = " + expr.format(rs=rs, rt=rt))
+            ops.append((alu, ins, 0, 0))
+        elif op == isa.OP_ADDI:
+            if rt:
+                body.append(f"R[{rt}] = (R[{rs}] + {d.imm}) & 0xFFFFFFFF")
+            ops.append((ALU_ADD, I_ADDI, 0, 0))
+        elif op in (isa.OP_LW, isa.OP_SW):
+            body.append(f"a = (R[{rs}] + {d.imm}) & 0xFFFFFFFF")
+            body.append(f"if a & 3 or a >= {nwords * 4}: return {-1 - pc}")
+            if op == isa.OP_LW:
+                if rt:
+                    body.append(f"R[{rt}] = M[a >> 2]")
+                ops.append((ALU_ADD, I_LW, 1, 0))
+            else:
+                body.append(f"M[a >> 2] = R[{rt}]")
+                # Rewrote this block's own code: stop so it gets recompiled.
+                body.append(f"if {start * 4} <= a < @END@: return {-1 - (pc + 4)}")
+                ops.append((ALU_ADD, I_SW, 0, 1))
+        elif op == isa.OP_BEQ:
+            target = pc + 4 + (d.imm << 2)
+            if target < 0:
+                break          # would read as an early exit; let _cycle run it
+            end = f"return {target} if R[{rs}] == R[{rt}] else {pc + 4}"
+            ops.append((ALU_SUB, I_BEQ, 0, 0))
+            pc += 4
+            break
+        elif op == isa.OP_J:
+            end = f"return {((pc + 4) & 0xF0000000) | (d.addr << 2)}"
+            ops.append((-1, I_J, 0, 0))
+            pc += 4
+            break
+        else:
+            break              # halt or unknown opcode
+        pc += 4
+    if not ops:
+        return None
+
+    stop = start + len(ops)
+    # Stores check against the block's extent, only known now.
+    src = [f"    if M[{start}:{stop}] != RAW: return {-1 - start * 4}"]
+    src += ["    " + line.replace("@END@", str(stop * 4)) for line in body]
+    src.append("    " + (end or f"return {pc}"))
+    code = "def block(R, M):\n" + "\n".join(src) + "\n"
+    ns = {"RAW": words[start:stop]}
+    exec(compile(code, f"<block @{start * 4:#x}>", "exec"), ns)
+    return Block(ns["block"], start * 4, ops)
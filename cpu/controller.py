@@ -31,7 +31,8 @@ class RunController:
             _ = input("[Enter=step, q=quit] ")
             if _ and _.strip().lower().startswith('q'):
                 break
-            self.model.step()
+            # Always refresh in single-step mode, whatever notify_every says.
+            self.model.step_and_notify()
             c += 1
             if max_cycles is not None and c >= max_cycles:
                 break
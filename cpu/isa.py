@@ -1,6 +1,7 @@
 """Instruction-set helpers: encode/decode and register naming tables."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 # MIPS-like encodings (big-endian conceptual layout, but we store ints)
@@ -36,7 +37,27 @@ REG_NAMES = {
     28:"$gp", 29:"$sp", 30:"$fp", 31:"$ra",
 }
 
-@dataclass
+# Instruction formats, looked up by opcode instead of re-testing it per call.
+KIND_UNKNOWN = 0
+KIND_R = 1
+KIND_I = 2
+KIND_J = 3
+
+_DECODE_OP_KIND = [KIND_UNKNOWN] * 64
+_DECODE_OP_KIND[OP_RTYPE] = KIND_R
+for _op in (OP_LW, OP_SW, OP_BEQ, OP_ADDI):
+    _DECODE_OP_KIND[_op] = KIND_I
+_DECODE_OP_KIND[OP_J] = KIND_J
+del _op
+
+_FUNCT_MNEMONIC = {
+    FUNCT_ADD:"add", FUNCT_SUB:"sub", FUNCT_AND:"and",
+    FUNCT_OR:"or", FUNCT_SLT:"slt",
+}
+_OP_MNEMONIC = {OP_LW:"lw", OP_SW:"sw", OP_BEQ:"beq", OP_ADDI:"addi", OP_J:"j"}
+
+# Frozen because decode() hands the same cached instance to every caller.
+@dataclass(frozen=True)
 class DecodedInstr:
     raw: int
     opcode: int
@@ -51,40 +72,33 @@ class DecodedInstr:
 
 def sign_extend_16(x: int) -> int:
     """Convert a 16-bit immediate into a Python int with sign extension."""
-    x &= 0xFFFF
-    if x & 0x8000:
-        return x - 0x10000
-    return x
+    # Branchless: flipping bit 15 and subtracting it back borrows through the
+    # upper bits exactly when the sign bit was set.
+    return ((x & 0xFFFF) ^ 0x8000) - 0x8000
 
+@lru_cache(maxsize=4096)
 def decode(word: int) -> DecodedInstr:
     """Break a 32-bit instruction word into its constituent fields."""
     # The decoder keeps policy out of the model: adding a new instruction is a
-    # matter of updating this function plus the execute logic.
+    # matter of updating the tables above plus the execute logic. Results are
+    # memoised because loops re-decode the same handful of words.
     if word == HALT_WORD:
         return DecodedInstr(raw=word, opcode=-1, mnemonic="halt")
     opcode = (word >> 26) & 0x3F
-    if opcode == OP_RTYPE:
-        rs = (word >> 21) & 0x1F
-        rt = (word >> 16) & 0x1F
-        rd = (word >> 11) & 0x1F
-        shamt = (word >> 6) & 0x1F
+    kind = _DECODE_OP_KIND[opcode]
+    if kind == KIND_R:
         funct = word & 0x3F
-        mnem = {
-            FUNCT_ADD:"add", FUNCT_SUB:"sub", FUNCT_AND:"and",
-            FUNCT_OR:"or", FUNCT_SLT:"slt"
-        }.get(funct, "unknown")
-        return DecodedInstr(raw=word, opcode=opcode, rs=rs, rt=rt, rd=rd, shamt=shamt, funct=funct, mnemonic=mnem)
-    elif opcode in (OP_LW, OP_SW, OP_BEQ, OP_ADDI):
-        rs = (word >> 21) & 0x1F
-        rt = (word >> 16) & 0x1F
-        imm = sign_extend_16(word & 0xFFFF)
-        mnem = {OP_LW:"lw", OP_SW:"sw", OP_BEQ:"beq", OP_ADDI:"addi"}[opcode]
-        return DecodedInstr(raw=word, opcode=opcode, rs=rs, rt=rt, imm=imm, mnemonic=mnem)
-    elif opcode == OP_J:
-        addr = word & 0x3FFFFFF
-        return DecodedInstr(raw=word, opcode=opcode, addr=addr, mnemonic="j")
-    else:
-        return DecodedInstr(raw=word, opcode=opcode, mnemonic="unknown")
+        return DecodedInstr(raw=word, opcode=opcode,
+                            rs=(word >> 21) & 0x1F, rt=(word >> 16) & 0x1F,
+                            rd=(word >> 11) & 0x1F, shamt=(word >> 6) & 0x1F,
+                            funct=funct, mnemonic=_FUNCT_MNEMONIC.get(funct, "unknown"))
+    if kind == KIND_I:
+        return DecodedInstr(raw=word, opcode=opcode,
+                            rs=(word >> 21) & 0x1F, rt=(word >> 16) & 0x1F,
+                            imm=sign_extend_16(word), mnemonic=_OP_MNEMONIC[opcode])
+    if kind == KIND_J:
+        return DecodedInstr(raw=word, opcode=opcode, addr=word & 0x3FFFFFF, mnemonic="j")
+    return DecodedInstr(raw=word, opcode=opcode, mnemonic="unknown")
 
 def encode_r(rs, rt, rd, shamt, funct):
     """Build an R-type instruction word from its fields."""
@@ -0,0 +1,174 @@
+"""Native fast path for the fetch-decode-execute loop.
+
+`run_native` is the same single-cycle datapath as `CPUModel.step`, written
+against flat buffers instead of the model's objects so that Numba can compile
+the whole interpreter loop into machine code:
+- `mem` is the unified memory's `array('I')` word storage (index = addr >> 2),
+- `regs` is `CPUModel.regs` (32 registers plus the unused ZERO_SINK slot),
+- `alu_counters`/`instr_counters` are the matching `Stats` arrays, bumped in
+  place; the scalar counters come back in the return tuple.
+
+Both native builds are optional. A Cython extension compiled from
+`cpu/_core.pyx` (`make cext`) replaces `run_native` when it is importable,
+since it needs no JIT warm-up. Otherwise, if Numba is installed, `load_numba`
+compiles the function below, but only once a run has lasted long enough to pay
+for it (`NUMBA_MIN_CYCLES`, see `CPUModel._run_numba`). Until then, and with
+neither build, `CPUModel.run` runs compiled Python basic blocks instead
+(`CPUModel._run_blocks`, see cpu/blocks.py); this module still imports and
+`run_native` still works as ordinary Python.
+"""
+
+import importlib.util
+
+
+from .isa import (OP_RTYPE, OP_J, OP_BEQ, OP_ADDI, OP_LW, OP_SW,
+                  FUNCT_ADD, FUNCT_SUB, FUNCT_AND, FUNCT_OR, FUNCT_SLT, HALT_WORD)
+from .stats import (ALU_ADD, ALU_SUB, ALU_AND, ALU_OR, ALU_SLT,
+                    I_ADD, I_SUB, I_AND, I_OR, I_SLT, I_ADDI, I_LW, I_SW, I_BEQ, I_J, I_HALT)
+
+try:
+    from ._core import run_native as _cext_run_native
+except ImportError:  # pragma: no cover - only present after `make cext`
+    _cext_run_native = None
+
+HAVE_CEXT = _cext_run_native is not None
+
+# Only look for Numba here; importing it costs ~0.5 s and loading the cached
+# compiled loop ~0.35 s more, which load_numba pays on first use.
+HAVE_NUMBA = not HAVE_CEXT and importlib.util.find_spec("numba") is not None
+NUMBA_LOADED = False   # set once load_numba has swapped in the compiled loop
+
+# Cycles the block path runs before Numba takes over. At ~4 Mcyc/s for the
+# blocks and ~100 Mcyc/s for Numba, the ~0.85 s start-up breaks even near
+# 3.5M cycles; shorter runs are faster without it.
+NUMBA_MIN_CYCLES = 4_000_000
+
+# Why run_native stopped.
+STATUS_BUDGET = 0   # max_cycles reached, CPU still running
+STATUS_HALTED = 1   # retired a halt word
+STATUS_FAULT = 2    # the instruction at `pc` would raise; nothing was executed
+
+
+def run_native(mem, regs, pc, max_cycles, alu_counters, instr_counters):
+    """Execute up to max_cycles instructions (-1 = no limit) starting at pc.
+
+    Returns `(pc, status, cycles, data_reads, data_writes)`; every retired
+    cycle is also one instruction fetch. On STATUS_FAULT the faulting
+    instruction has not touched any state, so the caller can replay it through
+    `CPUModel._cycle()` to raise the usual MemoryError/ValueError.
+    """
+    nwords = len(mem)
+    n = 0
+    reads = 0
+    writes = 0
+    while max_cycles < 0 or n < max_cycles:
+        if pc & 3 or pc < 0 or (pc >> 2) >= nwords:
+            return pc, STATUS_FAULT, n, reads, writes
+        word = int(mem[pc >> 2])
+        if word == HALT_WORD:
+            instr_counters[I_HALT] += 1
+            return pc, STATUS_HALTED, n + 1, reads, writes
+
+        # Hand-inlined isa.decode: every format shares the opcode/rs/rt slots.
+        opcode = (word >> 26) & 0x3F
+        rs = (word >> 21) & 0x1F
+        rt = (word >> 16) & 0x1F
+        imm = ((word & 0xFFFF) ^ 0x8000) - 0x8000
+        a = int(regs[rs])
+        b = int(regs[rt])
+        next_pc = pc + 4
+
+        if opcode == OP_RTYPE:
+            rd = (word >> 11) & 0x1F
+            funct = word & 0x3F
+            if funct == FUNCT_ADD:
+                res = (a + b) & 0xFFFFFFFF
+                alu = ALU_ADD
+                ins = I_ADD
+            elif funct == FUNCT_SUB:
+                res = (a - b) & 0xFFFFFFFF
+                alu = ALU_SUB
+                ins = I_SUB
+            elif funct == FUNCT_AND:
+                res = a & b
+                alu = ALU_AND
+                ins = I_AND
+            elif funct == FUNCT_OR:
+                res = a | b
+                alu = ALU_OR
+                ins = I_OR
+            elif funct == FUNCT_SLT:
+                res = (((a ^ 0x80000000) - (b ^ 0x80000000)) >> 63) & 1
+                alu = ALU_SLT
+                ins = I_SLT
+            else:
+                return pc, STATUS_FAULT, n, reads, writes
+            if rd != 0:
+                regs[rd] = res
+            alu_counters[alu] += 1
+            instr_counters[ins] += 1
+
+        elif opcode == OP_ADDI:
+            if rt != 0:
+                regs[rt] = (a + imm) & 0xFFFFFFFF
+            alu_counters[ALU_ADD] += 1
+            instr_counters[I_ADDI] += 1
+
+        elif opcode == OP_LW:
+            addr = (a + imm) & 0xFFFFFFFF
+            if addr & 3 or (addr >> 2) >= nwords:
+                return pc, STATUS_FAULT, n, reads, writes
+            if rt != 0:
+                regs[rt] = mem[addr >> 2]
+            alu_counters[ALU_ADD] += 1
+            reads += 1
+            instr_counters[I_LW] += 1
+
+        elif opcode == OP_SW:
+            addr = (a + imm) & 0xFFFFFFFF
+            if addr & 3 or (addr >> 2) >= nwords:
+                return pc, STATUS_FAULT, n, reads, writes
+            mem[addr >> 2] = b
+            alu_counters[ALU_ADD] += 1
+            writes += 1
+            instr_counters[I_SW] += 1
+
+        elif opcode == OP_BEQ:
+            if a == b:
+                next_pc = pc + 4 + (imm << 2)
+            alu_counters[ALU_SUB] += 1
+            instr_counters[I_BEQ] += 1
+
+        elif opcode == OP_J:
+            next_pc = ((pc + 4) & 0xF0000000) | ((word & 0x3FFFFFF) << 2)
+            instr_counters[I_J] += 1
+
+        else:
+            return pc, STATUS_FAULT, n, reads, writes
+
+        pc = next_pc
+        n += 1
+    return pc, STATUS_BUDGET, n, reads, writes
+
+
+if HAVE_CEXT:
+    run_native = _cext_run_native   # prebuilt core wins
+
+# True when run_native is, or load_numba can make it, compiled code rather
+# than the Python reference.
+HAVE_NATIVE = HAVE_CEXT or HAVE_NUMBA
+
+
+def load_numba() -> bool:
+    """Swap run_native for its Numba build; return False if Numba won't import."""
+    global run_native, NUMBA_LOADED, HAVE_NUMBA, HAVE_NATIVE
+    if not NUMBA_LOADED:
+        try:
+            from numba import njit
+        except ImportError:  # pragma: no cover - found but broken install
+            HAVE_NUMBA = False
+            HAVE_NATIVE = HAVE_CEXT
+            return False
+        run_native = njit(cache=True, boundscheck=False)(run_native)
+        NUMBA_LOADED = True
+    return True
@@ -3,8 +3,8 @@
 import sys
 import argparse
 from typing import List
-from .model import CPUModel
-from .view import TextView
+from .model import CPUModel, Memory
+from .view import TextView, BinaryLogView
 from .controller import RunController
 from .assembler import assemble
 
@@ -13,19 +13,13 @@ def load_bin_words(path: str) -> List[int]:
     words = []
     with open(path, 'r') as f:
         for line in f:
-            s = line.strip()
-            if not s: 
-                continue
-            if '#' in s:
-                s = s[:s.index('#')].strip()
+            s = line.split('#', 1)[0].strip()
             if not s:
                 continue
             # Accept both explicit 0x-prefixed numbers and bare hex digits so
-            # students can paste data straight from Project 1 dumps.
-            if s.lower().startswith("0x"):
-                w = int(s, 16)
-            else:
-                w = int(s, 16) if all(c in "0123456789abcdefABCDEFx" for c in s) else int(s)
+            # students can paste data straight from Project 1 dumps; int(s, 16)
+            # takes either form directly. Only signed values are decimal.
+            w = int(s) if s[0] in "+-" else int(s, 16)
             words.append(w & 0xFFFFFFFF)
     return words
 
@@ -38,6 +32,12 @@ def main():
     p.add_argument("--assemble", action="store_true", help="Treat input as .asm and assemble to .bin output")
     p.add_argument("--out", type=str, default=None, help="Output .bin when using --assemble")
     p.add_argument("--mem-bytes", type=int, default=64*1024, help="Total memory bytes")
+    p.add_argument("--notify-every", type=int, default=1,
+                   help="Print the scoreboard every N cycles (0 = only once the run ends)")
+    p.add_argument("--render-on-change", action="store_true",
+                   help="Skip scoreboards whose PC, registers and memory window are unchanged")
+    p.add_argument("--bin-log", type=str, default=None, metavar="PATH",
+                   help="Write binary (cycle, pc, registers) records to PATH instead of the scoreboard")
     args = p.parse_args()
 
     if args.assemble:
@@ -54,9 +54,8 @@ def main():
         return
 
     # Normal simulation
-    model = CPUModel()
-    model.mem.size_bytes = args.mem_bytes
-    model.mem.data = bytearray(args.mem_bytes)
+    model = CPUModel(mem=Memory(size_bytes=args.mem_bytes),
+                     notify_every=args.notify_every if args.notify_every > 0 else None)
 
     # Load program
     if args.program.lower().endswith(".asm"):
@@ -67,11 +66,18 @@ def main():
     model.load_words(words, base_addr=0)
 
     # Attach view + controller
-    view = TextView(mem_dump_words=32)
+    if args.bin_log:
+        view = BinaryLogView(args.bin_log)
+    else:
+        view = TextView(mem_dump_words=32, render_on_change=args.render_on_change)
     ctl = RunController(model, view, step_mode=args.step)
 
     # Run either in free-running or single-step mode depending on CLI flags.
-    ctl.run_all(max_cycles=args.max_cycles)
+    try:
+        ctl.run_all(max_cycles=args.max_cycles)
+    finally:
+        if args.bin_log:
+            view.close()
 
 if __name__ == "__main__":
     main()
@@ -4,27 +4,37 @@ This file represents the "Model" portion of the MVC split. Every other
 component (controllers, views, stats) hangs off this class, so documenting the
 data flow here makes it easier for a TA to grade or extend the project:
 1. Fetch instruction at the current PC from unified memory.
-2. Decode the 32-bit word into a structured `isa.DecodedInstr` record.
+2. Decode the 32-bit word with `isa.decode`. Decoded fields are cached per
+   word in flat `icache_*` arrays, so each word is only decoded once.
 3. Execute the instruction by manipulating registers/memory and stats.
 4. Update cycle counters, advance PC (or redirect for branches/jumps), notify
    observers (e.g., TextView) so they can refresh the scoreboard.
 """
 
+from array import array
 from dataclasses import dataclass, field
 from typing import List, Callable, Optional
 from .stats import Stats
 from . import isa
+from . import jit_core
+from .blocks import compile_block
+from .stats import ALU_ADD, ALU_SUB, ALU_AND, ALU_OR, ALU_SLT, INSTR_NAMES, I_HALT
 
 WORD = 4
-
-def mask32(x:int) -> int:
-    """Force a value into the unsigned 32-bit range."""
-    return x & 0xFFFFFFFF
+STEP_BATCH = 1024   # cycles between budget checks in CPUModel.run's step loop
 
 @dataclass
 class Memory:
     size_bytes: int = 64 * 1024
-    data: bytearray = field(default_factory=lambda: bytearray(64*1024))
+    # One array('I') slot per aligned word (index = addr >> 2). Every word
+    # access is a single indexed load/store; byte accessors pick bytes out of
+    # the containing word so the byte order stays big-endian.
+    data: Optional[array] = None
+
+    def __post_init__(self):
+        """Allocate zeroed word storage matching size_bytes."""
+        if self.data is None:
+            self.data = array('I', bytes(self.size_bytes & ~3))
 
     # NOTE: These helpers deliberately raise on misaligned/out-of-bounds access.
     #       That behavior mirrors the spec requirement and makes debugging a lot
@@ -32,83 +42,168 @@ class Memory:
 
     def read_word(self, addr: int) -> int:
         """Return a 32-bit aligned word, raising on misaligned/OOB addresses."""
-        if addr % 4 != 0 or addr < 0 or addr+3 >= self.size_bytes:
+        if addr & 3 or addr < 0 or addr+3 >= self.size_bytes:
             raise MemoryError(f"Unaligned or OOB word read @0x{addr:08X}")
-        b = self.data[addr:addr+4]
-        return int.from_bytes(b, byteorder="big", signed=False)
+        return self.data[addr >> 2]
 
     def write_word(self, addr: int, value: int):
         """Store a 32-bit aligned word after clamping to 32 bits."""
-        if addr % 4 != 0 or addr < 0 or addr+3 >= self.size_bytes:
+        if addr & 3 or addr < 0 or addr+3 >= self.size_bytes:
             raise MemoryError(f"Unaligned or OOB word write @0x{addr:08X}")
-        self.data[addr:addr+4] = mask32(value).to_bytes(4, byteorder="big", signed=False)
+        self.data[addr >> 2] = value & 0xFFFFFFFF
+
+    def load_bulk(self, words: List[int], base_addr: int = 0):
+        """Copy a run of words starting at base_addr in one slice assignment."""
+        n = len(words)
+        if base_addr & 3 or base_addr < 0 or base_addr + WORD * n > self.size_bytes:
+            raise MemoryError(f"Unaligned or OOB bulk write of {n} words @0x{base_addr:08X}")
+        try:
+            block = array('I', words)
+        except OverflowError:  # negative or >32-bit values: clamp like write_word
+            block = array('I', [w & 0xFFFFFFFF for w in words])
+        start = base_addr >> 2
+        self.data[start:start + n] = block
+
+    def read_words(self, addr: int, count: int) -> array:
+        """Return count aligned words from addr as an array('I') copy."""
+        end = WORD * len(self.data)
+        if addr & 3 or addr < 0 or count < 0 or addr + WORD * count > end:
+            # Name the first word read_word would have refused.
+            bad = addr if addr & 3 or addr < 0 or addr >= end else end
+            raise MemoryError(f"Unaligned or OOB word read @0x{bad:08X}")
+        start = addr >> 2
+        return self.data[start:start + count]
 
     def read_byte(self, addr: int) -> int:
         """Read a byte while checking bounds."""
         if addr < 0 or addr >= self.size_bytes:
             raise MemoryError(f"OOB byte read @0x{addr:08X}")
-        return self.data[addr]
+        shift = (3 - (addr & 3)) * 8  # byte 0 is the word's MSB
+        return (self.data[addr >> 2] >> shift) & 0xFF
 
     def write_byte(self, addr: int, value: int):
         """Write a byte while checking bounds and masking to 8 bits."""
         if addr < 0 or addr >= self.size_bytes:
             raise MemoryError(f"OOB byte write @0x{addr:08X}")
-        self.data[addr] = value & 0xFF
-
-@dataclass
-class RegisterFile:
-    regs: List[int] = field(default_factory=lambda: [0]*32)
+        shift = (3 - (addr & 3)) * 8
+        idx = addr >> 2
+        self.data[idx] = (self.data[idx] & ~(0xFF << shift) & 0xFFFFFFFF) | ((value & 0xFF) << shift)
 
-    def __getitem__(self, idx: int) -> int:
-        """Expose register contents while enforcing $zero immutability."""
-        return self.regs[idx] if idx != 0 else 0  # $zero stays 0
+# The register file is a bare array('I') with one slot past the 32
+# architectural registers. Writes whose destination is $zero are pointed at
+# ZERO_SINK when the instruction is decoded, so regs[0] always reads 0 without
+# an index check or a wrapper method on every access.
+NUM_REGS = 32
+ZERO_SINK = NUM_REGS
 
-    def __setitem__(self, idx: int, value: int):
-        """Write a register unless the target is $zero, matching hardware."""
-        if idx != 0:
-            self.regs[idx] = mask32(value)
+def new_register_file() -> array:
+    """Return a zeroed register array: 32 registers plus the ZERO_SINK slot."""
+    return array('I', bytes(4 * (NUM_REGS + 1)))
 
 @dataclass
 class ALU:
     # The ALU intentionally exposes only the handful of operations used by the
-    # ISA subset. New instructions can be implemented by adding methods here and
-    # then calling them from `CPUModel.execute`.
+    # ISA subset. A new instruction needs a method here and a `CPUModel._do_*`
+    # handler registered in `_build_dispatch`, and the same semantics again in
+    # every fast path: `jit_core.run_native`, `cpu/_core.pyx` and the block
+    # compiler in `cpu/blocks.py` (instructions it skips fall back to `_cycle`).
 
     def add(self, a:int, b:int) -> int:
         """Return (a + b) with 32-bit wraparound."""
-        return mask32((a + b) & 0xFFFFFFFF)
+        return (a + b) & 0xFFFFFFFF
 
     def sub(self, a:int, b:int) -> int:
         """Return (a - b) with 32-bit wraparound."""
-        return mask32((a - b) & 0xFFFFFFFF)
+        return (a - b) & 0xFFFFFFFF
 
     def bitand(self, a:int, b:int) -> int:
         """Return a & b constrained to 32 bits."""
-        return mask32(a & b)
+        return a & b
 
     def bitor(self, a:int, b:int) -> int:
         """Return a | b constrained to 32 bits."""
-        return mask32(a | b)
+        return a | b
 
     def slt(self, a:int, b:int) -> int:
         """Emulate signed set-less-than, producing 1 or 0."""
-        # signed compare
-        sa = a if a < 0x80000000 else a - 0x100000000
-        sb = b if b < 0x80000000 else b - 0x100000000
-        return 1 if sa < sb else 0
+        # Signed compare without branching on the sign bits: flipping bit 31
+        # maps signed order onto unsigned order, and the sign of the 64-bit
+        # difference is the answer.
+        return (((a ^ 0x80000000) - (b ^ 0x80000000)) >> 63) & 1
 
 Observer = Callable[["CPUModel"], None]
 
 @dataclass
 class CPUModel:
     mem: Memory = field(default_factory=Memory)
-    regs: RegisterFile = field(default_factory=RegisterFile)
+    regs: array = field(default_factory=new_register_file)
     alu: ALU = field(default_factory=ALU)
     stats: Stats = field(default_factory=Stats)
     pc: int = 0
     observers: List[Observer] = field(default_factory=list)
     running: bool = True
     instr_window: int = 64  # for view convenience
+    # How often step() notifies observers: every N cycles (and on halt). None
+    # (or any N <= 0, as with --notify-every=0) means run() notifies only
+    # once, when it returns.
+    notify_every: Optional[int] = 1
+
+    def __post_init__(self):
+        """Build the per-instance opcode dispatch tables and decode cache."""
+        if self.notify_every is not None and self.notify_every <= 0:
+            self.notify_every = None
+        self._build_dispatch()
+        self._alloc_icache()
+
+    def _alloc_icache(self):
+        """Allocate one pre-decoded slot per memory word (SoA layout)."""
+        # Each field of `isa.DecodedInstr` gets its own flat array indexed by
+        # pc >> 2, so a fetch reads a few ints instead of decoding the word and
+        # building a dataclass every cycle. `icache_raw` tags every slot with
+        # the word it was decoded from; a store that rewrites an instruction
+        # makes the tag mismatch and the slot is decoded again on its next
+        # fetch. All-zero slots already hold the decode of word 0x00000000.
+        n = len(self.mem.data)
+        self.icache_raw = array('I', bytes(4 * n))
+        self.icache_opcode = array('b', bytes(n))   # -1 marks halt
+        self.icache_rs = array('B', bytes(n))
+        self.icache_rt = array('B', bytes(n))
+        self.icache_rd = array('B', bytes(n))
+        self.icache_dest = array('B', [ZERO_SINK]) * n  # register written, or ZERO_SINK
+        self.icache_shamt = array('B', bytes(n))
+        self.icache_funct = array('B', bytes(n))
+        self.icache_imm = array('h', bytes(2 * n))
+        self.icache_addr = array('I', bytes(4 * n))
+        self.icache_mnemonic = [isa.decode(0).mnemonic] * n
+        self.icache_instr = array('b', [-1]) * n  # index into stats.INSTR_NAMES
+        # Compiled basic blocks (see cpu/blocks.py), keyed by start pc. Blocks
+        # check their own words on entry, so stale ones are never run.
+        self.blocks = {}
+        self._block_list = []     # every block with hits not yet in stats
+        self._block_mem = self.mem.data
+
+    def _predecode(self, idx: int, raw: int):
+        """Decode raw into icache slot idx."""
+        d = isa.decode(raw)
+        self.icache_raw[idx] = raw
+        self.icache_opcode[idx] = d.opcode
+        self.icache_rs[idx] = d.rs
+        self.icache_rt[idx] = d.rt
+        self.icache_rd[idx] = d.rd
+        if d.opcode == isa.OP_RTYPE:
+            dest = d.rd
+        elif d.opcode in (isa.OP_ADDI, isa.OP_LW):
+            dest = d.rt
+        else:
+            dest = 0
+        self.icache_dest[idx] = dest or ZERO_SINK
+        self.icache_shamt[idx] = d.shamt
+        self.icache_funct[idx] = d.funct
+        self.icache_imm[idx] = d.imm
+        self.icache_addr[idx] = d.addr
+        self.icache_mnemonic[idx] = d.mnemonic
+        # Unknown encodings keep -1; execute() raises before it is ever counted.
+        self.icache_instr[idx] = INSTR_NAMES.index(d.mnemonic) if d.mnemonic in INSTR_NAMES else -1
 
     def attach(self, obs: Observer):
         """Register an observer callback invoked after each cycle."""
@@ -120,11 +215,13 @@ class CPUModel:
             obs(self)
 
     def load_words(self, words: List[int], base_addr: int = 0):
-        """Sequentially write a list of machine words starting at base_addr."""
-        addr = base_addr
-        for w in words:
-            self.mem.write_word(addr, w)
-            addr += WORD
+        """Write a list of machine words starting at base_addr and pre-decode them."""
+        if len(self.icache_raw) != len(self.mem.data):
+            self._alloc_icache()  # memory was swapped out after construction
+        self.mem.load_bulk(words, base_addr)
+        start = base_addr >> 2
+        for idx, w in enumerate(self.mem.data[start:start + len(words)], start):
+            self._predecode(idx, w)
 
     def fetch(self) -> int:
         """Grab the instruction pointed at by PC and update fetch stats."""
@@ -132,107 +229,329 @@ class CPUModel:
         self.stats.bump_instr_fetch()
         return instr
 
+    def fetch_slot(self) -> int:
+        """Fetch the instruction at PC and return its decoded icache slot."""
+        raw = self.fetch()
+        idx = self.pc >> 2
+        if self.icache_raw[idx] != raw:
+            self._predecode(idx, raw)
+        return idx
+
     def step(self):
-        """Run one fetch-decode-execute sequence in the single-cycle core."""
+        """Run one cycle, notifying observers as `notify_every` asks."""
         if not self.running:
             return
-        raw = self.fetch()
-        dec = isa.decode(raw)
-        if dec.mnemonic == "halt":
+        self._cycle()
+        every = self.notify_every
+        if every is not None and (not self.running or self.stats.cycles % every == 0):
+            self.notify()
+
+    def step_and_notify(self):
+        """Run one cycle and always notify (interactive single-step mode)."""
+        if not self.running:
+            return
+        self._cycle()
+        self.notify()
+
+    def _cycle(self):
+        """Run one fetch-decode-execute sequence in the single-cycle core."""
+        i = self.fetch_slot()
+        mnemonic = self.icache_mnemonic[i]
+        if mnemonic == "halt":
             self.running = False
-            self.stats.bump_instr("halt")
+            self.stats.instr_counters[I_HALT] += 1
             self.stats.bump_cycle()
-            self.notify()
             return
 
-        # Default next PC is fall-through (PC + 4). Control-flow instructions
-        # can override it by calling `set_next_pc` via the closure below.
-        next_pc = self.pc + WORD  # PC + 4 by default
-        self.execute(dec, lambda new_pc: self._set_next_pc(new_pc, setter=locals()))
-        self.stats.bump_instr(dec.mnemonic or "unknown")
+        # Control-flow instructions return their target; everything else
+        # returns None and falls through to PC + 4.
+        next_pc = self.execute(i)
+        self.stats.instr_counters[self.icache_instr[i]] += 1
         self.stats.bump_cycle()
-        self.pc = next_pc
-        self.notify()
-
-    def _set_next_pc(self, new_pc: int, setter: dict):
-        """Helper used to mutate the caller's next_pc closure variable."""
-        setter['next_pc'] = new_pc
+        self.pc = next_pc if next_pc is not None else self.pc + WORD
 
     def run(self, max_cycles: Optional[int] = None):
         """Keep stepping until halt or an optional cycle budget is hit."""
-        c = 0
+        if not self.running:
+            return
+        every = self.notify_every
+        if every is None or not self.observers:
+            # Nobody needs a per-cycle scoreboard, so the whole run can stay
+            # inside one batch loop. Observers see the final state.
+            self._run_batch(max_cycles)
+            self.notify()
+            return
+        # Like the batch loops, always retire at least one instruction.
+        left = None if max_cycles is None else max(max_cycles, 1)
+        if every > 1:
+            # Observers only look every `every` cycles, so the cycles in
+            # between go through the batch loop and step()'s cadence is
+            # reproduced by stopping at each multiple of `every`.
+            st = self.stats
+            while self.running and (left is None or left > 0):
+                chunk = every - st.cycles % every
+                if left is not None and chunk > left:
+                    chunk = left
+                start = st.cycles
+                self._run_batch(chunk)
+                if left is not None:
+                    left -= st.cycles - start
+                if not self.running or st.cycles % every == 0:
+                    self.notify()
+            return
+        # Per-cycle notifications: run step() in fixed-size batches so the
+        # budget check happens once per batch instead of once per cycle.
+        step = self.step
         while self.running:
-            self.step()
-            c += 1
-            if max_cycles is not None and c >= max_cycles:
+            n = STEP_BATCH if left is None else min(STEP_BATCH, left)
+            for _ in range(n):
+                step()
+                if not self.running:
+                    return
+            if left is not None:
+                left -= n
+                if left <= 0:
+                    return
+
+    def _run_batch(self, max_cycles: Optional[int]):
+        """Run without notifying: native core if available, else compiled blocks."""
+        if not jit_core.HAVE_NATIVE:
+            self._run_blocks(max_cycles)
+        elif jit_core.HAVE_CEXT or jit_core.NUMBA_LOADED:
+            self._run_native(max_cycles)
+        else:
+            self._run_numba(max_cycles)
+
+    def _run_numba(self, max_cycles: Optional[int]):
+        """Run on blocks first; hand over to Numba only if the run keeps going."""
+        # Importing Numba and loading the compiled loop costs about as much as
+        # NUMBA_MIN_CYCLES block cycles, so short runs never pay for it.
+        warm = jit_core.NUMBA_MIN_CYCLES
+        if max_cycles is not None and max_cycles <= warm:
+            self._run_blocks(max_cycles)
+            return
+        st = self.stats
+        start = st.cycles
+        if warm:
+            self._run_blocks(warm)
+            if not self.running:
+                return
+        left = None if max_cycles is None else max_cycles - (st.cycles - start)
+        if jit_core.load_numba():
+            self._run_native(left)
+        else:
+            self._run_blocks(left)
+
+    def _run_native(self, max_cycles: Optional[int]):
+        """Run via jit_core.run_native and add its totals into stats."""
+        if not self.running:
+            return
+        # Like the step loop, always retire at least one instruction.
+        budget = -1 if max_cycles is None else max(max_cycles, 1)
+        st = self.stats
+        self.pc, status, cycles, reads, writes = jit_core.run_native(
+            self.mem.data, self.regs, self.pc, budget, st.alu_counters, st.instr_counters)
+        st.cycles += cycles
+        st.instr_reads += cycles
+        st.data_reads += reads
+        st.data_writes += writes
+        if status == jit_core.STATUS_HALTED:
+            self.running = False
+        elif status == jit_core.STATUS_FAULT:
+            # The native loop stopped before touching any state, so replaying
+            # the instruction through _cycle() (step() would also notify)
+            # raises the same error step() always has.
+            self._cycle()
+
+    def _run_blocks(self, max_cycles: Optional[int]):
+        """Pure-Python batch loop over compiled basic blocks."""
+        if not self.running:
+            return
+        left = -1 if max_cycles is None else max(max_cycles, 1)
+        words = self.mem.data
+        if words is not self._block_mem:
+            self._alloc_icache()   # memory was swapped out; blocks baked its size
+        blocks = self.blocks
+        get = blocks.get
+        regs = self.regs
+        pc = self.pc
+        try:
+            while left:
+                b = get(pc)
+                if b is None:
+                    b = compile_block(words, pc)
+                    if b is None:
+                        # halt, an unknown encoding or a bad pc: one ordinary
+                        # cycle retires it or raises the usual error.
+                        self.pc = pc
+                        self._cycle()
+                        pc = self.pc
+                        left -= 1
+                        if not self.running:
+                            break
+                        continue
+                    blocks[pc] = b
+                    self._block_list.append(b)
+                if 0 < left < b.n:
+                    break          # budget ends mid-block; finished below
+                next_pc = b.fn(regs, words)
+                if next_pc >= 0:
+                    b.hits += 1
+                    left -= b.n
+                    pc = next_pc
+                    continue
+                # Early exit (see cpu/blocks.py): the block is stale or about
+                # to fault, so drop it and account for the part that ran.
+                resume = -1 - next_pc
+                del blocks[pc]
+                ran = (resume - pc) >> 2
+                self._account_ops(b.ops[:ran])
+                left -= ran
+                pc = resume
+                if not ran:
+                    self.pc = pc
+                    self._cycle()   # stale: re-run through the icache; fault: raise
+                    pc = self.pc
+                    left -= 1
+                    if not self.running:
+                        break
+        finally:
+            self.pc = pc
+            self._fold_block_hits()
+        # Fewer than one block's worth of cycles remain: plain cycles.
+        cycle = self._cycle
+        for _ in range(max(left, 0)):
+            if not self.running:
                 break
+            cycle()
+
+    def _account_ops(self, ops):
+        """Add per-instruction Block.ops entries straight into stats."""
+        st = self.stats
+        for alu, ins, reads, writes in ops:
+            if alu >= 0:
+                st.alu_counters[alu] += 1
+            st.instr_counters[ins] += 1
+            st.data_reads += reads
+            st.data_writes += writes
+        st.cycles += len(ops)
+        st.instr_reads += len(ops)
+
+    def _fold_block_hits(self):
+        """Move the blocks' pending execution counts into stats."""
+        st = self.stats
+        live = []
+        for b in self._block_list:
+            h = b.hits
+            if h:
+                b.hits = 0
+                st.cycles += h * b.n
+                st.instr_reads += h * b.n
+                st.data_reads += h * b.reads
+                st.data_writes += h * b.writes
+                for i, c in b.alu:
+                    st.alu_counters[i] += h * c
+                for i, c in b.instr:
+                    st.instr_counters[i] += h * c
+            if self.blocks.get(b.start) is b:
+                live.append(b)
+        self._block_list = live
+
+    def execute(self, i: int) -> Optional[int]:
+        """Implement the instruction in icache slot i; return a new PC or None."""
+        # (halt's opcode of -1 lands on slot 63, which is never populated.)
+        h = self._op_handlers[self.icache_opcode[i]]
+        if h is None:
+            raise ValueError(f"Unknown opcode {self.icache_opcode[i]:#x} ({self.icache_mnemonic[i]})")
+        return h(i)
+
+    def _build_dispatch(self):
+        """Fill the opcode/funct -> handler tables used by execute()."""
+        # Indexing a 64-entry list by opcode (and by funct for R-type) replaces
+        # walking an if/elif chain on every retired instruction. Adding an
+        # instruction means writing a `_do_*` handler and registering it here.
+        self._op_handlers = [None] * 64
+        self._op_handlers[isa.OP_RTYPE] = self._do_rtype
+        self._op_handlers[isa.OP_ADDI] = self._do_addi
+        self._op_handlers[isa.OP_LW] = self._do_lw
+        self._op_handlers[isa.OP_SW] = self._do_sw
+        self._op_handlers[isa.OP_BEQ] = self._do_beq
+        self._op_handlers[isa.OP_J] = self._do_j
+
+        self._funct_handlers = [None] * 64
+        self._funct_handlers[isa.FUNCT_ADD] = self._do_add
+        self._funct_handlers[isa.FUNCT_SUB] = self._do_sub
+        self._funct_handlers[isa.FUNCT_AND] = self._do_and
+        self._funct_handlers[isa.FUNCT_OR] = self._do_or
+        self._funct_handlers[isa.FUNCT_SLT] = self._do_slt
+
+    def _do_rtype(self, i: int) -> None:
+        """Second-level dispatch on funct for register-register ops."""
+        h = self._funct_handlers[self.icache_funct[i]]
+        if h is None:
+            raise ValueError(f"Unknown R-type funct {self.icache_funct[i]:#x}")
+        h(i)
+
+    def _do_add(self, i: int):
+        """Handle add: rd <- rs + rt."""
+        r = self.regs
+        r[self.icache_dest[i]] = self.alu.add(r[self.icache_rs[i]], r[self.icache_rt[i]])
+        self.stats.alu_counters[ALU_ADD] += 1
 
-    def execute(self, d: isa.DecodedInstr, set_next_pc):
-        """Implement the behavior for every supported opcode."""
-        # `set_next_pc` is a small indirection that lets branch/jump handlers
-        # update the caller's `next_pc` variable without returning a tuple.
+    def _do_sub(self, i: int):
+        """Handle sub: rd <- rs - rt."""
         r = self.regs
-        a = self.alu
+        r[self.icache_dest[i]] = self.alu.sub(r[self.icache_rs[i]], r[self.icache_rt[i]])
+        self.stats.alu_counters[ALU_SUB] += 1
 
-        if d.opcode == isa.OP_RTYPE:
-            rs, rt, rd = r[d.rs], r[d.rt], d.rd
-            if d.funct == isa.FUNCT_ADD:
-                res = a.add(rs, rt)
-                r[rd] = res
-                self.stats.bump_alu("add")
-            elif d.funct == isa.FUNCT_SUB:
-                res = a.sub(rs, rt)
-                r[rd] = res
-                self.stats.bump_alu("sub")
-            elif d.funct == isa.FUNCT_AND:
-                res = a.bitand(rs, rt)
-                r[rd] = res
-                self.stats.bump_alu("and")
-            elif d.funct == isa.FUNCT_OR:
-                res = a.bitor(rs, rt)
-                r[rd] = res
-                self.stats.bump_alu("or")
-            elif d.funct == isa.FUNCT_SLT:
-                res = a.slt(rs, rt)
-                r[rd] = res
-                self.stats.bump_alu("slt")
-            else:
-                raise ValueError(f"Unknown R-type funct {d.funct:#x}")
-
-        elif d.opcode == isa.OP_ADDI:
-            # rt <- rs + imm
-            val = self.alu.add(self.regs[d.rs], d.imm & 0xFFFFFFFF)
-            self.regs[d.rt] = val
-            self.stats.bump_alu("add")  # ALU add for addi
-
-        elif d.opcode == isa.OP_LW:
-            # rt <- MEM[rs + imm]
-            addr = (self.alu.add(self.regs[d.rs], d.imm & 0xFFFFFFFF))  # address calc counts as add
-            self.stats.bump_alu("add")
-            val = self.mem.read_word(addr)
-            self.stats.bump_data_read()
-            self.regs[d.rt] = val
-
-        elif d.opcode == isa.OP_SW:
-            # MEM[rs + imm] <- rt
-            addr = (self.alu.add(self.regs[d.rs], d.imm & 0xFFFFFFFF))
-            self.stats.bump_alu("add")
-            self.mem.write_word(addr, self.regs[d.rt])
-            self.stats.bump_data_write()
-
-        elif d.opcode == isa.OP_BEQ:
-            # if rs == rt: PC <- PC+4 + (imm<<2)
-            # We'll implement as (rs - rt) == 0 via ALU sub (counts as arithmetic op)
-            diff = self.alu.sub(self.regs[d.rs], self.regs[d.rt])
-            self.stats.bump_alu("sub")  # beq compare uses sub
-            if diff == 0:
-                offset = d.imm << 2
-                set_next_pc(self.pc + 4 + offset)
-
-        elif d.opcode == isa.OP_J:
-            # jump: target = (PC+4)[31:28] | (addr << 2)
-            target = ((self.pc + 4) & 0xF0000000) | (d.addr << 2)
-            set_next_pc(target)
+    def _do_and(self, i: int):
+        """Handle and: rd <- rs & rt."""
+        r = self.regs
+        r[self.icache_dest[i]] = self.alu.bitand(r[self.icache_rs[i]], r[self.icache_rt[i]])
+        self.stats.alu_counters[ALU_AND] += 1
 
-        else:
-            raise ValueError(f"Unknown opcode {d.opcode:#x} ({d.mnemonic})")
+    def _do_or(self, i: int):
+        """Handle or: rd <- rs | rt."""
+        r = self.regs
+        r[self.icache_dest[i]] = self.alu.bitor(r[self.icache_rs[i]], r[self.icache_rt[i]])
+        self.stats.alu_counters[ALU_OR] += 1
+
+    def _do_slt(self, i: int):
+        """Handle slt: rd <- (rs < rt), signed."""
+        r = self.regs
+        r[self.icache_dest[i]] = self.alu.slt(r[self.icache_rs[i]], r[self.icache_rt[i]])
+        self.stats.alu_counters[ALU_SLT] += 1
+
+    def _do_addi(self, i: int):
+        """Handle addi: rt <- rs + imm."""
+        r = self.regs
+        r[self.icache_dest[i]] = self.alu.add(r[self.icache_rs[i]], self.icache_imm[i] & 0xFFFFFFFF)
+        self.stats.alu_counters[ALU_ADD] += 1  # ALU add for addi
+
+    def _do_lw(self, i: int):
+        """Handle lw: rt <- MEM[rs + imm]."""
+        addr = self.alu.add(self.regs[self.icache_rs[i]], self.icache_imm[i] & 0xFFFFFFFF)  # address calc counts as add
+        self.stats.alu_counters[ALU_ADD] += 1
+        val = self.mem.read_word(addr)
+        self.stats.bump_data_read()
+        self.regs[self.icache_dest[i]] = val
+
+    def _do_sw(self, i: int):
+        """Handle sw: MEM[rs + imm] <- rt."""
+        addr = self.alu.add(self.regs[self.icache_rs[i]], self.icache_imm[i] & 0xFFFFFFFF)
+        self.stats.alu_counters[ALU_ADD] += 1
+        self.mem.write_word(addr, self.regs[self.icache_rt[i]])
+        self.stats.bump_data_write()
+
+    def _do_beq(self, i: int) -> Optional[int]:
+        """Handle beq: if rs == rt, PC <- PC+4 + (imm<<2)."""
+        # Implemented as (rs - rt) == 0 via ALU sub (counts as arithmetic op)
+        diff = self.alu.sub(self.regs[self.icache_rs[i]], self.regs[self.icache_rt[i]])
+        self.stats.alu_counters[ALU_SUB] += 1  # beq compare uses sub
+        if diff == 0:
+            return self.pc + 4 + (self.icache_imm[i] << 2)
+        return None
+
+    def _do_j(self, i: int) -> int:
+        """Handle j: PC <- (PC+4)[31:28] | (addr << 2)."""
+        return ((self.pc + 4) & 0xF0000000) | (self.icache_addr[i] << 2)
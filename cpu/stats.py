@@ -1,7 +1,30 @@
 """Centralized performance counters (acts like the project's "scoreboard")."""
 
+from array import array
 from dataclasses import dataclass, field
-from collections import defaultdict
+from types import MappingProxyType
+
+# Per-operation counters live in flat int64 arrays indexed by these constants,
+# so the hot loops (including jit_core.run_native) bump them with one indexed
+# add instead of a method call plus a dict update.
+ALU_NAMES = ("add", "sub", "and", "or", "slt")
+ALU_ADD, ALU_SUB, ALU_AND, ALU_OR, ALU_SLT = range(len(ALU_NAMES))
+
+INSTR_NAMES = ("add", "sub", "and", "or", "slt", "addi", "lw", "sw", "beq", "j", "halt")
+(I_ADD, I_SUB, I_AND, I_OR, I_SLT, I_ADDI,
+ I_LW, I_SW, I_BEQ, I_J, I_HALT) = range(len(INSTR_NAMES))
+
+_ALU_INDEX = {name: i for i, name in enumerate(ALU_NAMES)}
+_INSTR_INDEX = {name: i for i, name in enumerate(INSTR_NAMES)}
+# (index, name) pairs in name order, so the dict views come out sorted
+# without a sort per call.
+_ALU_BY_NAME = tuple(sorted(enumerate(ALU_NAMES), key=lambda p: p[1]))
+_INSTR_BY_NAME = tuple(sorted(enumerate(INSTR_NAMES), key=lambda p: p[1]))
+
+
+def _counter_array(n: int) -> array:
+    """Return n zeroed int64 counters."""
+    return array('q', bytes(8 * n))
 
 
 @dataclass
@@ -10,8 +33,48 @@ class Stats:
     instr_reads: int = 0          # instruction fetches
     data_reads: int = 0
     data_writes: int = 0
-    alu_ops: dict = field(default_factory=lambda: defaultdict(int))  # e.g., {"add": 3, "sub": 1, "cmp": 2}
-    instr_counts: dict = field(default_factory=lambda: defaultdict(int))
+    alu_counters: array = field(default_factory=lambda: _counter_array(len(ALU_NAMES)))
+    instr_counters: array = field(default_factory=lambda: _counter_array(len(INSTR_NAMES)))
+    # Last (counters snapshot, text) for alu_str/instr_str. The hot loops bump
+    # the arrays directly, so staleness is detected by comparing snapshots.
+    _alu_str: tuple = field(default=(None, ""), init=False, repr=False, compare=False)
+    _instr_str: tuple = field(default=(None, ""), init=False, repr=False, compare=False)
+
+    # alu_ops/instr_counts are read-only views of the counter arrays (and not
+    # constructor arguments): `alu_ops["add"] += 1` raises TypeError rather
+    # than updating a throwaway copy. Count with bump_alu/bump_instr.
+
+    @property
+    def alu_ops(self) -> MappingProxyType:
+        """Read-only ALU op counts keyed by name, in name order, e.g. {"add": 3}; zeros omitted."""
+        c = self.alu_counters
+        return MappingProxyType({name: c[i] for i, name in _ALU_BY_NAME if c[i]})
+
+    @property
+    def instr_counts(self) -> MappingProxyType:
+        """Read-only retired-instruction counts keyed by mnemonic, in name order; zeros omitted."""
+        c = self.instr_counters
+        return MappingProxyType({name: c[i] for i, name in _INSTR_BY_NAME if c[i]})
+
+    @property
+    def alu_str(self) -> str:
+        """alu_ops as "add:3, sub:1" (name order), or "(none)"; rebuilt only on change."""
+        key = self.alu_counters.tobytes()
+        if key != self._alu_str[0]:
+            c = self.alu_counters
+            text = ", ".join([f"{name}:{c[i]}" for i, name in _ALU_BY_NAME if c[i]]) or "(none)"
+            self._alu_str = (key, text)
+        return self._alu_str[1]
+
+    @property
+    def instr_str(self) -> str:
+        """instr_counts formatted like alu_str; rebuilt only on change."""
+        key = self.instr_counters.tobytes()
+        if key != self._instr_str[0]:
+            c = self.instr_counters
+            text = ", ".join([f"{name}:{c[i]}" for i, name in _INSTR_BY_NAME if c[i]]) or "(none)"
+            self._instr_str = (key, text)
+        return self._instr_str[1]
 
     def bump_cycle(self):
         """Increment the simulated cycle counter."""
@@ -31,8 +94,8 @@ class Stats:
 
     def bump_alu(self, op_name: str):
         """Increment the count for a named ALU operation."""
-        self.alu_ops[op_name] += 1
+        self.alu_counters[_ALU_INDEX[op_name]] += 1
 
     def bump_instr(self, mnemonic: str):
         """Increment the retired-instruction counter for mnemonic."""
-        self.instr_counts[mnemonic] += 1
+        self.instr_counters[_INSTR_INDEX[mnemonic]] += 1
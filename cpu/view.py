@@ -1,73 +1,220 @@
-"""Text-only view that prints a scoreboard every cycle.
+"""Views that observe the model: a text scoreboard and a binary cycle log.
 
 This file is the "View" slice of MVC. It does not influence execution; it only
 observes the model and formats the state so humans can follow along while
 grading or debugging.
 """
 
+import binascii
+import operator
+import struct
+import sys
+from array import array
+
 from . import isa
 
+try:  # optional Cython helpers, built with `make cext`
+    from ._view import dump_registers as _c_dump_registers, dump_memory as _c_dump_memory
+except ImportError:  # pragma: no cover - only present after `make cext`
+    _c_dump_registers = _c_dump_memory = None
+
+# Register labels padded to the column width once, instead of a dict lookup
+# and an f-string per register on every render.
+_REG_LABELS = tuple(f"{isa.REG_NAMES.get(i, f'$r{i}'):<5}" for i in range(32))
+# The whole register block as one %-template, so all 32 values are formatted
+# by a single C-level `%` call. "%#10x" matches the old "{:>#10x}".
+_REG_TEMPLATE = "\n".join(
+    "  ".join(f"{_REG_LABELS[i + j]}=%#10x" for j in range(4))
+    for i in range(0, 32, 4)).encode("ascii")
+_REG_LABELS_ASCII = "".join(_REG_LABELS).encode("ascii")   # for _c_dump_registers
+
+# The scoreboard is produced as ASCII bytes (see render), so the fixed
+# pieces are bytes too.
+_EQ78 = b"=" * 78
+_DASH78 = b"-" * 78
+_MEM_HEADER_FMT = "Memory [0 .. {}):"
+_CYCLE_LINE = b"Cycle %6d | PC=0x%08X | Running=%s"
+_RUNNING = (b"False", b"True")
+
 
 class TextView:
-    def __init__(self, mem_dump_words: int = 32, show_all_mem: bool = False):
+    """Observer that prints the scoreboard: PC, registers, a memory window, stats."""
+
+    def __init__(self, mem_dump_words: int = 32, show_all_mem: bool = False,
+                 render_every: int = 1, render_on_change: bool = False):
         """Configure how much state the textual view should display."""
         self.mem_dump_words = mem_dump_words
         self.show_all_mem = show_all_mem
+        if render_every < 1:
+            raise ValueError(f"render_every must be >= 1, got {render_every}")
+        # Sampling gates checked before any formatting: print only every
+        # render_every-th notification and/or only when the visible machine
+        # state moved. The final (halted) state is always printed.
+        self.render_every = render_every
+        self.render_on_change = render_on_change
+        self._calls = 0
+        self._last_sig = None
+        self._mem_header = _MEM_HEADER_FMT.format(mem_dump_words * 4).encode("ascii")
+        self._buf = bytearray()   # reused for every scoreboard
+        self._addr_prefix = [b"%08x: " % (i * 4) for i in range(mem_dump_words)]
         self.prev_mem = {}
+        # (snapshot, formatted bytes) of the last render of each section, so
+        # an unchanged section is reused after one equality check.
+        self._reg_cache = (None, b"")
+        self._mem_cache = (None, b"")
+        self._stats_cache = (None, b"")
 
     def __call__(self, model):
         """Let the view be used as an observer callback."""
+        calls = self._calls = self._calls + 1
+        running = model.running
+        if running and calls % self.render_every:
+            return
+        if self.render_on_change:
+            try:
+                window = model.mem.read_words(0, self.mem_dump_words)
+            except MemoryError:
+                window = None
+            sig = (model.pc, running, model.regs[:32], window)
+            if sig == self._last_sig:
+                return
+            self._last_sig = sig
         self.render(model)
 
     def _dump_registers(self, regs):
-        """Format the register file as aligned rows of hex values."""
+        """Format the register file as aligned rows of hex values (ASCII bytes)."""
+        snap = regs[:32]
+        cache = self._reg_cache
+        if snap == cache[0]:
+            return cache[1]
         # Registers are grouped four per row to keep the output manageable. The
-        # names table comes from `isa.py`, so any alias changes propagate here.
-        rows = []
-        names = isa.REG_NAMES
-        for i in range(0, 32, 4):
-            row = []
-            for j in range(4):
-                idx = i + j
-                row.append(f"{names.get(idx, f'$r{idx}'):<5}={regs[idx]:>#10x}")
-            rows.append("  ".join(row))
-        return "\n".join(rows)
+        # labels come from `isa.py`, so any alias changes propagate here.
+        if _c_dump_registers is not None and isinstance(snap, array):
+            text = _c_dump_registers(snap, _REG_LABELS_ASCII)
+        else:
+            text = _REG_TEMPLATE % tuple(snap)
+        self._reg_cache = (snap, text)
+        return text
 
     def _dump_memory(self, mem):
-        """Return a small hex dump of memory words for quick inspection."""
-        # Show the first mem_dump_words words and any words written since last cycle
-        words = []
-        for addr in range(0, self.mem_dump_words * 4, 4):
-            w = mem.read_word(addr)
-            words.append((addr, w))
-
-        # Find modified words (if any); for safety in unified memory, pack small window
-        # (We don't track writes history here; just show the first block.)
-        lines = [f"{addr:08x}: {val:08x}" for addr, val in words]
-        return "\n".join(lines)
+        """Return a small hex dump of memory words (ASCII bytes) for quick inspection."""
+        # One bulk read serves as the cache key; only a changed window is
+        # re-encoded.
+        nwords = self.mem_dump_words
+        words = mem.read_words(0, nwords)
+        cache = self._mem_cache
+        if words == cache[0]:
+            return cache[1]
+        if _c_dump_memory is not None:
+            text = _c_dump_memory(words)
+        else:
+            # Show the first mem_dump_words words: one hexlify call encodes the
+            # whole (big-endian) window, split into 8-digit words that are
+            # glued onto precomputed "addr: " prefixes. `words` stays
+            # untouched as the cache key.
+            be = words[:]
+            if sys.byteorder == "little":
+                be.byteswap()
+            digits = binascii.hexlify(be, b" ", 4).split()
+            text = b"\n".join(map(operator.add, self._addr_prefix, digits))
+        self._mem_cache = (words, text)
+        return text
+
+    def _dump_stats(self, stats):
+        """Format the three stats lines of the scoreboard (ASCII bytes)."""
+        cycles, fetches = stats.cycles, stats.instr_reads
+        reads, writes = stats.data_reads, stats.data_writes
+        sig = (cycles, fetches, reads, writes,
+               stats.alu_counters.tobytes(), stats.instr_counters.tobytes())
+        cache = self._stats_cache
+        if sig == cache[0]:
+            return cache[1]
+        alu = stats.alu_str
+        ic = stats.instr_str
+        # f-strings are compiled into the bytecode once, so there is no
+        # template to pre-parse; a bound str.format or %-template here
+        # measured ~20-30% slower than the f-string.
+        text = (f"  cycles={cycles}  instr_fetches={fetches}  "
+                f"data_reads={reads}  data_writes={writes}\n"
+                f"  alu_ops={{ {alu} }}\n"
+                f"  instr_counts={{ {ic} }}").encode("ascii")
+        self._stats_cache = (sig, text)
+        return text
 
     def render(self, model):
         """Print the current cycle, PC, registers, memory, and stats."""
         # The ASCII separators make the scoreboard easy to scan when running
-        # dozens of cycles. Views are intentionally stateless so they can be
-        # swapped for GUI/CSV loggers later.
-        print("="*78)
-        print(f"Cycle {model.stats.cycles:>6} | PC=0x{model.pc:08X} | Running={model.running}")
-        print("-"*78)
-        print("Registers:")
-        print(self._dump_registers(model.regs))
-        print("-"*78)
-        print("Memory [0 .. {limit}):".format(limit=self.mem_dump_words*4))
+        # dozens of cycles. Views hold no simulation state (only the caches of
+        # their own formatted text) so they can be swapped for GUI/CSV loggers
+        # later.
+        # The scoreboard is assembled as bytes in one reused buffer and written
+        # in a single call, so there is no per-line print() and no str->bytes
+        # encode of the whole board on the way out.
+        # Each model attribute is read once into a local.
+        stats = model.stats
+        buf = self._buf
+        del buf[:]
+        buf += _EQ78
+        buf += b"\n"
+        buf += _CYCLE_LINE % (stats.cycles, model.pc, _RUNNING[bool(model.running)])
+        buf += b"\n"
+        buf += _DASH78
+        buf += b"\nRegisters:\n"
+        buf += self._dump_registers(model.regs)
+        buf += b"\n"
+        buf += _DASH78
+        buf += b"\n"
+        buf += self._mem_header
+        buf += b"\n"
         try:
-            print(self._dump_memory(model.mem))
+            buf += self._dump_memory(model.mem)
         except Exception as e:
-            print(f"<memory view error: {e}>")
-        print("-"*78)
-        print("Stats:")
-        alu = ", ".join([f"{k}:{v}" for k,v in sorted(model.stats.alu_ops.items())]) or "(none)"
-        ic  = ", ".join([f"{k}:{v}" for k,v in sorted(model.stats.instr_counts.items())]) or "(none)"
-        print(f"  cycles={model.stats.cycles}  instr_fetches={model.stats.instr_reads}  "
-              f"data_reads={model.stats.data_reads}  data_writes={model.stats.data_writes}")
-        print(f"  alu_ops={{ {alu} }}")
-        print(f"  instr_counts={{ {ic} }}")
-        print("="*78)
+            buf += f"<memory view error: {e}>".encode("ascii", "replace")
+        buf += b"\n"
+        buf += _DASH78
+        buf += b"\nStats:\n"
+        buf += self._dump_stats(stats)
+        buf += b"\n"
+        buf += _EQ78
+        buf += b"\n"
+        out = getattr(sys.stdout, "buffer", None)
+        if out is None:          # e.g. redirected to a StringIO
+            sys.stdout.write(buf.decode("ascii"))
+        else:
+            sys.stdout.flush()   # keep ordering with anything printed as text
+            out.write(buf)
+
+
+class BinaryLogView:
+    """Observer that logs one fixed-size binary record per notification.
+
+    Meant for batch runs where nobody reads the scoreboard: nothing is
+    formatted, each cycle just appends `RECORD` (little-endian cycle count,
+    PC, then $0..$31) to the file. `read` decodes a log afterwards. The PC is
+    signed: a `beq` can leave it below 0 for the cycle before the fault.
+    """
+
+    RECORD = struct.Struct("<Qq32I")
+
+    def __init__(self, path: str):
+        """Open path for writing; records are appended as the model runs."""
+        self._f = open(path, "wb")
+        self._buf = bytearray(self.RECORD.size)
+        self._pack_into = self.RECORD.pack_into
+
+    def __call__(self, model):
+        """Append the model's current cycle, PC and registers."""
+        buf = self._buf
+        self._pack_into(buf, 0, model.stats.cycles, model.pc, *model.regs[:32])
+        self._f.write(buf)
+
+    def close(self):
+        """Flush and close the log file."""
+        self._f.close()
+
+    @classmethod
+    def read(cls, path: str):
+        """Yield (cycle, pc, regs) for each record in a log written by this view."""
+        with open(path, "rb") as f:
+            for rec in cls.RECORD.iter_unpack(f.read()):
+                yield rec[0], rec[1], rec[2:]
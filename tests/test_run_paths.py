@@ -0,0 +1,249 @@
+"""CPUModel.run() must end in exactly the state that stepping one cycle at a
+time reaches: same PC, registers, memory, stats and error.
+
+run() without a native core goes through the compiled basic blocks in
+cpu/blocks.py (`CPUModel._run_blocks`), which is where stale-block detection,
+the early exit after a store into a block's own code, fault replay through
+`_cycle()` and budgets that end mid-block all live. Each program below is run
+both ways and the end states compared.
+"""
+
+import os
+import random
+
+import pytest
+
+from cpu import isa, jit_core
+from cpu.assembler import assemble
+from cpu.model import CPUModel, Memory
+
+MEM_BYTES = 0x800
+SAMPLE_ASM = os.path.join(os.path.dirname(__file__), "..", "programs", "sample.asm")
+
+
+@pytest.fixture(params=["blocks", "native"])
+def backend(request, monkeypatch):
+    """Run each test with the native core switched off, then (if built) on."""
+    if request.param == "blocks":
+        monkeypatch.setattr(jit_core, "HAVE_NATIVE", False)
+    elif not jit_core.HAVE_NATIVE:
+        pytest.skip("no native core (Numba or `make cext`) in this install")
+    else:
+        # Hand over from blocks to Numba after a few cycles instead of
+        # millions, so the handover and the Numba loop both get exercised.
+        monkeypatch.setattr(jit_core, "NUMBA_MIN_CYCLES", 5)
+    return request.param
+
+
+def _model(words, data=()):
+    m = CPUModel(mem=Memory(size_bytes=MEM_BYTES))
+    m.load_words(words)
+    for addr, word in data:
+        m.mem.write_word(addr, word)
+    return m
+
+
+def _state(m, err):
+    s = m.stats
+    return {
+        "pc": m.pc,
+        "running": m.running,
+        "regs": list(m.regs[:32]),
+        "mem": list(m.mem.data),
+        "stats": (s.cycles, s.instr_reads, s.data_reads, s.data_writes,
+                  dict(s.alu_ops), dict(s.instr_counts)),
+        "err": err,
+    }
+
+
+def _stepped(words, budgets, data=()):
+    """Reference: one step() per cycle, honouring run()'s budget rules."""
+    m = _model(words, data)
+    err = None
+    try:
+        for b in budgets:
+            n = 0
+            while m.running and (b is None or n < max(b, 1)):
+                m.step()
+                n += 1
+    except (MemoryError, ValueError) as e:
+        err = (type(e), str(e))
+    return _state(m, err)
+
+
+def _ran(words, budgets, data=()):
+    m = _model(words, data)
+    err = None
+    try:
+        for b in budgets:
+            m.run(max_cycles=b)
+    except (MemoryError, ValueError) as e:
+        err = (type(e), str(e))
+    return _state(m, err)
+
+
+def _check(src, budgets=(None,), data=()):
+    words = assemble(src.splitlines()) if isinstance(src, str) else src
+    ref = _stepped(words, budgets, data)
+    assert _ran(words, budgets, data) == ref
+    return ref
+
+
+def test_sample_program(backend):
+    with open(SAMPLE_ASM) as f:
+        ref = _check(f.read())
+    assert ref["stats"][0] == 7 and not ref["running"]
+
+
+COUNT_LOOP = """
+    addi $t0, $zero, 0
+    addi $t1, $zero, 100
+loop:
+    beq  $t0, $t1, done
+    addi $t0, $t0, 1
+    sw   $t0, 0x400($zero)
+    lw   $t2, 0x400($zero)
+    add  $t3, $t3, $t2
+    j    loop
+done:
+    halt
+"""
+
+
+def test_loop_to_halt(backend):
+    ref = _check(COUNT_LOOP)
+    assert ref["regs"][8] == 100 and not ref["running"]
+
+
+@pytest.mark.parametrize("budget", [1, 2, 5, 6, 7, 63, 64, 65, 101])
+def test_budget_ends_mid_block(backend, budget):
+    _check(COUNT_LOOP, budgets=[budget] * 200)
+
+
+def test_store_into_own_block_stops_it(backend):
+    # The sw turns the next-but-one word of the same block into a halt.
+    ref = _check("""
+        addi $t0, $zero, -1
+        sw   $t0, 12($zero)
+        addi $t1, $zero, 1
+        addi $t1, $t1, 1
+        addi $t2, $zero, 7
+        halt
+    """)
+    assert ref["pc"] == 12 and ref["regs"][9] == 1 and ref["regs"][10] == 0
+
+
+def test_store_into_compiled_block_recompiles_it(backend):
+    # The second pass stores over the first word of the loop body, which a
+    # block compiled on that pass starts with; the third pass must see
+    # addi $t1, $t1, 100 instead of addi $t1, $t1, 1.
+    old, new = assemble(["addi $t1, $t1, 1", "addi $t1, $t1, 100"])
+    ref = _check("""
+        addi $t0, $zero, 0
+        addi $t4, $zero, 4
+        addi $t5, $zero, 0
+    loop:
+        addi $t1, $t1, 1
+        addi $t0, $t0, 1
+        beq  $t0, $t4, done
+        lw   $t2, 0x200($t5)
+        sw   $t2, 12($zero)
+        addi $t5, $zero, 4
+        j    loop
+    done:
+        halt
+    """, data=[(0x200, old), (0x204, new)])
+    assert ref["regs"][9] == 202
+
+
+@pytest.mark.parametrize("src, err", [
+    # lw faulting after other instructions of its block have run
+    ("addi $t0, $zero, 1\naddi $t1, $zero, 2\nlw $t2, 2($zero)\nhalt", MemoryError),
+    # sw past the end of memory as the first instruction of a block
+    ("addi $t0, $zero, 3\nj bad\nhalt\nbad:\nsw $t0, 0x7FFC($zero)\nhalt", MemoryError),
+    # a branch target below address 0
+    ([isa.encode_i(isa.OP_ADDI, 0, 8, 1), isa.encode_i(isa.OP_BEQ, 0, 0, -4),
+      isa.HALT_WORD], MemoryError),
+    # a jump past the end of memory
+    ([isa.encode_i(isa.OP_ADDI, 0, 8, 1), isa.encode_j(isa.OP_J, MEM_BYTES >> 2),
+      isa.HALT_WORD], MemoryError),
+])
+def test_faults_are_replayed(backend, src, err):
+    ref = _check(src)
+    assert ref["err"][0] is err
+
+
+def test_unknown_encoding_is_replayed(backend):
+    words = assemble(["addi $t0, $zero, 1", "addi $t1, $zero, 2"])
+    words += [isa.encode_r(8, 9, 10, 0, 0x3F), isa.HALT_WORD]
+    ref = _check(words)
+    assert ref["err"][0] is ValueError and ref["regs"][9] == 2
+
+
+def _random_program(r):
+    n = r.randint(5, 40)
+    regs = [0, 8, 9, 10, 11]
+    words = []
+    for i in range(n):
+        k = r.random()
+        rs, rt, rd = r.choice(regs), r.choice(regs), r.choice(regs)
+        if k < 0.3:
+            words.append(isa.encode_r(rs, rt, rd, 0, r.choice(
+                [isa.FUNCT_ADD, isa.FUNCT_SUB, isa.FUNCT_AND, isa.FUNCT_OR, isa.FUNCT_SLT])))
+        elif k < 0.5:
+            words.append(isa.encode_i(isa.OP_ADDI, rs, rt, r.randint(-5, 5)))
+        elif k < 0.6:
+            off = r.choice([0x400, 0x404, 0x408]) if r.random() < 0.9 else r.choice([0x401, 0x7FFC, -4])
+            words.append(isa.encode_i(isa.OP_LW, 0, rt, off))
+        elif k < 0.7:
+            # Sometimes aimed at the program itself.
+            off = r.choice([0x400, 0x404, 0x408]) if r.random() < 0.8 else r.randrange(n) * 4
+            words.append(isa.encode_i(isa.OP_SW, 0, rt, off))
+        elif k < 0.85:
+            words.append(isa.encode_i(isa.OP_BEQ, rs, rt, r.randint(-i - 1, n - i)))
+        elif k < 0.93:
+            words.append(isa.encode_j(isa.OP_J, r.randrange(n + 2)))
+        elif k < 0.96:
+            words.append(isa.HALT_WORD)
+        else:
+            words.append(r.getrandbits(32))
+    return words + [isa.HALT_WORD]
+
+
+@pytest.mark.parametrize("seed", range(150))
+def test_random_programs(backend, seed):
+    r = random.Random(seed)
+    words = _random_program(r)
+    budgets = [r.choice([1, 3, 17, 64, 65, 200]) for _ in range(8)]
+    _check(words, budgets=budgets)
+
+
+def _notifications(every, budgets, use_run):
+    """Observer calls as (cycles, pc, running) for one way of running COUNT_LOOP."""
+    m = CPUModel(mem=Memory(size_bytes=MEM_BYTES), notify_every=every)
+    m.load_words(assemble(COUNT_LOOP.splitlines()))
+    seen = []
+    m.attach(lambda mm: seen.append((mm.stats.cycles, mm.pc, mm.running)))
+    for b in budgets:
+        if not m.running:
+            break
+        if use_run:
+            m.run(max_cycles=b)
+            continue
+        n = 0
+        while m.running and (b is None or n < max(b, 1)):
+            m.step()
+            n += 1
+        if m.notify_every is None:
+            m.notify()   # run() notifies once when it returns
+    return seen
+
+
+@pytest.mark.parametrize("every", [1, 3, None, 0])
+@pytest.mark.parametrize("budgets", [[None], [7] * 200, [64, 1, 100] * 10, [2] * 500])
+def test_notify_every_cadence(backend, every, budgets):
+    ref = _notifications(every, budgets, use_run=False)
+    assert _notifications(every, budgets, use_run=True) == ref
+    assert ref[-1][2] is False            # every case runs to the halt
+    if every in (None, 0):
+        assert len(ref) <= len(budgets)   # at most one notification per run()
@@ -0,0 +1,158 @@
+"""TextView boards must be byte-identical whichever formatter builds them.
+
+The register block comes from the Cython helper (`make cext`) or the
+%-template, the memory window from the Cython helper or hexlify. Each
+available backend is compared against a reference render written the way
+the original per-value f-string view was. BinaryLogView's records are
+checked by reading a log back.
+"""
+
+import io
+import os
+import random
+import sys
+
+import pytest
+
+from cpu import isa, view
+from cpu.assembler import assemble
+from cpu.model import CPUModel, Memory
+
+SAMPLE_ASM = os.path.join(os.path.dirname(__file__), "..", "programs", "sample.asm")
+
+
+@pytest.fixture(params=["python", "cext"])
+def backend(request, monkeypatch):
+    """Render with the pure-Python formatters, then (if built) the Cython ones."""
+    if request.param == "python":
+        monkeypatch.setattr(view, "_c_dump_registers", None)
+        monkeypatch.setattr(view, "_c_dump_memory", None)
+    elif view._c_dump_registers is None:
+        pytest.skip("cpu/_view.pyx is not built (`make cext`)")
+    return request.param
+
+
+def _reference(model, mem_dump_words):
+    """The original scoreboard, one f-string per value."""
+    names = isa.REG_NAMES
+    rows = []
+    for i in range(0, 32, 4):
+        rows.append("  ".join(f"{names.get(i + j, f'$r{i + j}'):<5}={model.regs[i + j]:>#10x}"
+                              for j in range(4)))
+    try:
+        mem = "\n".join(f"{a:08x}: {model.mem.read_word(a):08x}"
+                        for a in range(0, mem_dump_words * 4, 4))
+    except MemoryError as e:
+        mem = f"<memory view error: {e}>"
+    st = model.stats
+    alu = ", ".join(f"{k}:{v}" for k, v in sorted(st.alu_ops.items())) or "(none)"
+    ic = ", ".join(f"{k}:{v}" for k, v in sorted(st.instr_counts.items())) or "(none)"
+    lines = [
+        "=" * 78,
+        f"Cycle {st.cycles:>6} | PC=0x{model.pc:08X} | Running={model.running}",
+        "-" * 78,
+        "Registers:",
+        "\n".join(rows),
+        "-" * 78,
+        f"Memory [0 .. {mem_dump_words * 4}):",
+        mem,
+        "-" * 78,
+        "Stats:",
+        f"  cycles={st.cycles}  instr_fetches={st.instr_reads}  "
+        f"data_reads={st.data_reads}  data_writes={st.data_writes}",
+        f"  alu_ops={{ {alu} }}",
+        f"  instr_counts={{ {ic} }}",
+        "=" * 78,
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _rendered(tv, model, monkeypatch):
+    out = io.TextIOWrapper(io.BytesIO(), encoding="ascii")
+    monkeypatch.setattr(sys, "stdout", out)
+    tv.render(model)
+    out.flush()
+    return out.buffer.getvalue().decode("ascii")
+
+
+def _check(tv, model, monkeypatch):
+    assert _rendered(tv, model, monkeypatch) == _reference(model, tv.mem_dump_words)
+
+
+@pytest.mark.parametrize("value", [0, 0xFFFFFFFF, 0x80000000, 0x0000000F, 0x10])
+def test_register_extremes(backend, monkeypatch, value):
+    m = CPUModel(mem=Memory(size_bytes=256))
+    for i in range(32):
+        m.regs[i] = value
+        m.mem.write_word(i * 4, value)
+    _check(view.TextView(), m, monkeypatch)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_states(backend, monkeypatch, seed):
+    r = random.Random(seed)
+    m = CPUModel(mem=Memory(size_bytes=512))
+    tv = view.TextView(mem_dump_words=r.choice([0, 1, 8, 32, 40]))
+    m.pc = r.randrange(0, 1 << 32, 4)
+    # Render repeatedly, changing registers and the memory window in between,
+    # so the cached sections have to be rebuilt.
+    for _ in range(4):
+        for i in range(32):
+            m.regs[i] = r.getrandbits(32) >> r.randrange(32)
+        for a in range(0, 160, 4):
+            if r.random() < 0.3:
+                m.mem.write_word(a, r.getrandbits(32) >> r.randrange(32))
+        m.stats.cycles += 1
+        _check(tv, m, monkeypatch)
+        _check(tv, m, monkeypatch)   # unchanged: served from the caches
+
+
+def test_memory_window_past_end_of_memory(backend, monkeypatch):
+    m = CPUModel(mem=Memory(size_bytes=64))
+    tv = view.TextView(mem_dump_words=32)
+    text = _rendered(tv, m, monkeypatch)
+    assert "<memory view error: Unaligned or OOB word read @0x00000040>" in text
+    assert text == _reference(m, 32)
+
+
+def test_sample_program_trace(backend, monkeypatch):
+    with open(SAMPLE_ASM) as f:
+        words = assemble(f.read().splitlines())
+    m = CPUModel()
+    m.load_words(words)
+    tv = view.TextView()
+    while m.running:
+        m.step()
+        _check(tv, m, monkeypatch)
+
+
+def test_binary_log_round_trip(tmp_path):
+    with open(SAMPLE_ASM) as f:
+        words = assemble(f.read().splitlines())
+    m = CPUModel()
+    m.load_words(words)
+    path = tmp_path / "run.log"
+    log = view.BinaryLogView(str(path))
+    m.attach(log)
+    m.run()
+    log.close()
+    assert view.BinaryLogView.RECORD.size == 144
+    assert path.stat().st_size == 7 * 144
+    records = list(view.BinaryLogView.read(str(path)))
+    assert [(c, pc) for c, pc, _ in records] == [(1, 4), (2, 8), (3, 12), (4, 16),
+                                                 (5, 24), (6, 32), (7, 32)]
+    assert records[-1] == (7, 32, tuple(m.regs[:32]))
+
+
+def test_binary_log_negative_pc(tmp_path):
+    # beq $zero, $zero, -3 jumps to -8; the log must take that cycle before
+    # the fetch at -8 faults.
+    m = CPUModel()
+    m.load_words([isa.encode_i(isa.OP_BEQ, 0, 0, -3), isa.HALT_WORD])
+    path = tmp_path / "neg.log"
+    log = view.BinaryLogView(str(path))
+    m.attach(log)
+    with pytest.raises(MemoryError):
+        m.run()
+    log.close()
+    assert [(c, pc) for c, pc, _ in view.BinaryLogView.read(str(path))] == [(1, -8)]